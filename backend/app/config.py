@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 from zoneinfo import ZoneInfo
 
+import orjson
 from pydantic import BaseModel, Field
 
 from .utils.paths import CONFIG_PATH
@@ -18,6 +20,7 @@ class AppConfig(BaseModel):
     mention_name: str = Field("", alias="MENTION_NAME")
     check_interval_minutes: int = Field(10, alias="CHECK_INTERVAL_MINUTES")
     retry_delay_minutes: int = Field(5, alias="RETRY_DELAY_MINUTES")
+    max_concurrent_checks: int = Field(3, alias="MAX_CONCURRENT_CHECKS")
 
     class Config:
         allow_population_by_field_name = True
@@ -28,27 +31,38 @@ class ConfigManager:
     def __init__(self, config_path: Path = CONFIG_PATH) -> None:
         self._config_path = config_path
         self._config_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self._config_path.exists():
-            default = AppConfig()
-            self.write_config(default)
-        self._config = self.read_config()
+        self._lock = threading.Lock()
+        if self._config_path.exists():
+            self._config = self.read_config()
+        else:
+            self._config = AppConfig()
+            self.write_config(self._config)
+        self._mtime = self._config_path.stat().st_mtime
+        self._timezone = ZoneInfo("Etc/GMT+3")
 
     @property
     def timezone(self) -> ZoneInfo:
-        return ZoneInfo("Etc/GMT+3")
+        return self._timezone
 
     def read_config(self) -> AppConfig:
-        with self._config_path.open("r", encoding="utf-8") as fh:
-            payload: Dict[str, Any] = json.load(fh)
+        payload: Dict[str, Any] = orjson.loads(self._config_path.read_bytes())
         return AppConfig.parse_obj(payload)
 
     def write_config(self, config: AppConfig) -> None:
-        with self._config_path.open("w", encoding="utf-8") as fh:
-            json.dump(config.dict(by_alias=True), fh, indent=2)
+        tmp_path = self._config_path.with_suffix(".tmp")
+        tmp_path.write_bytes(
+            orjson.dumps(config.dict(by_alias=True), option=orjson.OPT_INDENT_2)
+        )
+        os.replace(tmp_path, self._config_path)
+        self._mtime = self._config_path.stat().st_mtime
 
     def reload(self) -> AppConfig:
-        self._config = self.read_config()
-        return self._config
+        with self._lock:
+            mtime = self._config_path.stat().st_mtime
+            if mtime != self._mtime:
+                self._config = self.read_config()
+                self._mtime = mtime
+            return self._config
 
     def get(self) -> AppConfig:
         return self._config
@@ -61,10 +75,18 @@ class ConfigManager:
                 normalized[field_name] = payload[alias]
             elif field_name in payload and payload[field_name] is not None:
                 normalized[field_name] = payload[field_name]
-        config = self._config.copy(update=normalized)
-        self.write_config(config)
-        self._config = config
-        return config
+        with self._lock:
+            changed = {
+                name: value
+                for name, value in normalized.items()
+                if getattr(self._config, name) != value
+            }
+            if not changed:
+                return self._config
+            config = self._config.copy(update=changed)
+            self.write_config(config)
+            self._config = config
+            return config
 
 
 __all__ = ["AppConfig", "ConfigManager"]
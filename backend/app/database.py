@@ -3,19 +3,33 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Generator
 
+from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine
 
 from .utils.paths import DB_PATH
 
-DATABASE_URL = f"sqlite:///{DB_PATH}" 
+DATABASE_URL = f"sqlite:///{DB_PATH}"
 
 database_engine = create_engine(
     DATABASE_URL,
     echo=False,
     connect_args={"check_same_thread": False},
+    pool_size=5,
+    max_overflow=10,
+    query_cache_size=1200,
 )
 
 
+@event.listens_for(database_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 def init_db() -> None:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     SQLModel.metadata.create_all(database_engine)
@@ -4,6 +4,7 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config import ConfigManager
@@ -14,7 +15,7 @@ from .utils.paths import DATA_DIR
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
-app = FastAPI(title="Frigate Manager")
+app = FastAPI(title="Frigate Manager", default_response_class=ORJSONResponse)
 
 config_manager = ConfigManager()
 scheduler = MonitorScheduler(config_manager)
@@ -35,6 +36,12 @@ async def on_startup() -> None:
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
     scheduler.shutdown()
+    from .services.monitor import close_browser, close_http_client
+    from .services.notifications import close_client
+
+    await close_browser()
+    await close_http_client()
+    await close_client()
 
 
 app.add_middleware(
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, Index, JSON
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -21,6 +21,7 @@ class Host(SQLModel, table=True):
 
 class FailureEvent(SQLModel, table=True):
     __tablename__ = "failure_events"
+    __table_args__ = (Index("ix_failure_events_host_created", "host_id", "created_at"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     host_id: int = Field(foreign_key="hosts.id")
@@ -30,7 +31,7 @@ class FailureEvent(SQLModel, table=True):
     first_screenshot_path: Optional[str] = None
     second_screenshot_path: Optional[str] = None
     log_files: list[str] = Field(default_factory=list, sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
     host: "Host" = Relationship(back_populates="failures")
     checks: List["HostCheck"] = Relationship(back_populates="failure")
@@ -38,6 +39,10 @@ class FailureEvent(SQLModel, table=True):
 
 class LogEntry(SQLModel, table=True):
     __tablename__ = "log_entries"
+    __table_args__ = (
+        Index("ix_log_entries_host_timestamp", "host_id", "timestamp"),
+        Index("ix_log_entries_host_service_timestamp", "host_id", "service", "timestamp"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     host_id: int = Field(foreign_key="hosts.id")
@@ -51,6 +56,7 @@ class LogEntry(SQLModel, table=True):
 
 class HostCheck(SQLModel, table=True):
     __tablename__ = "host_checks"
+    __table_args__ = (Index("ix_host_checks_host_created", "host_id", "created_at"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     host_id: int = Field(foreign_key="hosts.id")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import heapq
+import os
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from sqlmodel import func, select
 
 from ..database import get_session
@@ -16,20 +19,32 @@ from ..utils.paths import DATA_DIR, LOG_DIR, SCREENSHOT_DIR
 
 router = APIRouter(prefix="/failures", tags=["failures"])
 
+_DATA_ROOT = str(DATA_DIR)
+_DATA_PREFIX = _DATA_ROOT + os.sep
+
+
+def _failures_etag(session) -> str:
+    latest_id, total = session.exec(
+        select(func.max(FailureEvent.id), func.count(FailureEvent.id))
+    ).one()
+    return f'W/"failures-{latest_id or 0}-{total}"'
+
 
 def _public_media_path(raw_path: Optional[str]) -> Optional[str]:
     if not raw_path:
         return None
-    candidate = Path(raw_path)
-    if not candidate.is_absolute():
-        candidate = (DATA_DIR / candidate).resolve()
-    else:
-        candidate = candidate.resolve()
-    try:
-        relative = candidate.relative_to(DATA_DIR)
-    except ValueError:
-        return None
-    return f"/media/{relative.as_posix()}"
+    path = raw_path
+    if not os.path.isabs(path):
+        path = os.path.normpath(os.path.join(_DATA_ROOT, path))
+    if not path.startswith(_DATA_PREFIX):
+        # Slow path for symlinked or otherwise non-canonical locations.
+        try:
+            path = str(Path(raw_path).resolve())
+        except OSError:
+            return None
+        if not path.startswith(_DATA_PREFIX):
+            return None
+    return "/media/" + path[len(_DATA_PREFIX):].replace(os.sep, "/")
 
 
 def _serialize_failure(failure: FailureEvent) -> FailureEventRead:
@@ -59,6 +74,40 @@ def _gather_recent_files(paths: Iterable[str], limit: int = 2) -> List[str]:
     return results
 
 
+def _dir_mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _newest_matching_files(
+    base_dir: Path, prefix: str, suffix: tuple[str, ...], limit: int
+) -> tuple[str, ...]:
+    try:
+        with os.scandir(base_dir) as entries:
+            candidates = [
+                (entry.stat(follow_symlinks=False).st_mtime, entry.path)
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+            ]
+    except FileNotFoundError:
+        return ()
+    newest = heapq.nlargest(limit, candidates)
+    return tuple(path for _, path in newest)
+
+
+@lru_cache(maxsize=256)
+def _recent_screenshots(host_name: str, dir_mtime_ns: int) -> tuple[str, ...]:
+    # Old captures are .png; newer ones are compressed .jpg.
+    return _newest_matching_files(SCREENSHOT_DIR, f"{host_name}-", (".jpg", ".png"), 2)
+
+
+@lru_cache(maxsize=256)
+def _recent_log_files(host_name: str, dir_mtime_ns: int) -> tuple[str, ...]:
+    return _newest_matching_files(LOG_DIR, f"{host_name}-", (".log",), 3)
+
+
 def _latest_media(host: Host, failures: List[FailureEvent]) -> dict:
     screenshot_candidates: List[str] = []
     for failure in failures:
@@ -71,16 +120,9 @@ def _latest_media(host: Host, failures: List[FailureEvent]) -> dict:
         )
 
     if len(screenshot_candidates) < 2:
-        pattern = f"{host.name}-*.png"
-        recent_fs = sorted(
-            SCREENSHOT_DIR.glob(pattern),
-            key=lambda item: item.stat().st_mtime,
-            reverse=True,
+        screenshot_candidates.extend(
+            _recent_screenshots(host.name, _dir_mtime_ns(SCREENSHOT_DIR))
         )
-        for item in recent_fs:
-            screenshot_candidates.append(str(item))
-            if len(screenshot_candidates) >= 2:
-                break
 
     screenshot_paths = _gather_recent_files(screenshot_candidates, limit=2)
     captured_at: Optional[str] = None
@@ -103,13 +145,7 @@ def _latest_media(host: Host, failures: List[FailureEvent]) -> dict:
         log_candidates.extend(failure.log_files or [])
 
     if not log_candidates:
-        log_pattern = f"{host.name}-*.log"
-        recent_logs = sorted(
-            LOG_DIR.glob(log_pattern),
-            key=lambda item: item.stat().st_mtime,
-            reverse=True,
-        )
-        log_candidates = [str(item) for item in recent_logs[:3]]
+        log_candidates = list(_recent_log_files(host.name, _dir_mtime_ns(LOG_DIR)))
 
     logs = []
     for raw_path in _gather_recent_files(log_candidates, limit=5):
@@ -121,40 +157,62 @@ def _latest_media(host: Host, failures: List[FailureEvent]) -> dict:
 
 
 @router.get("", response_model=List[FailureEventRead])
-def list_failures(host_id: Optional[int] = None, limit: int = Query(100, le=1000)) -> List[FailureEventRead]:
+def list_failures(
+    request: Request,
+    response: Response,
+    host_id: Optional[int] = None,
+    limit: int = Query(100, le=1000),
+) -> List[FailureEventRead]:
     with get_session() as session:
+        etag = _failures_etag(session)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
         query = select(FailureEvent).order_by(FailureEvent.created_at.desc())
         if host_id:
             query = query.where(FailureEvent.host_id == host_id)
         if limit:
             query = query.limit(limit)
         failures = session.exec(query).all()
+    response.headers["ETag"] = etag
     return [_serialize_failure(failure) for failure in failures]
 
 
+# Aggregated stats keyed by the failures ETag, so repeated polls between
+# failures skip the GROUP BY entirely.
+_stats_cache: Optional[tuple[str, List[FailureStats]]] = None
+
+
 @router.get("/stats", response_model=List[FailureStats])
-def failure_stats() -> List[FailureStats]:
+def failure_stats(request: Request, response: Response) -> List[FailureStats]:
+    global _stats_cache
     with get_session() as session:
+        etag = _failures_etag(session)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        if _stats_cache is not None and _stats_cache[0] == etag:
+            response.headers["ETag"] = etag
+            return _stats_cache[1]
         stmt = (
             select(
                 FailureEvent.host_id,
                 func.count(FailureEvent.id),
-                func.sum(FailureEvent.failure_count),
+                func.coalesce(func.sum(FailureEvent.failure_count), 0),
                 func.max(FailureEvent.created_at),
             )
             .group_by(FailureEvent.host_id)
         )
         rows = session.exec(stmt).all()
-        stats: List[FailureStats] = []
-        for host_id, failures, total_cameras, last_failure in rows:
-            stats.append(
-                FailureStats(
-                    host_id=host_id,
-                    total_failures=failures,
-                    total_cameras_impacted=total_cameras or 0,
-                    last_failure=last_failure,
-                )
+        stats = [
+            FailureStats.construct(
+                host_id=host_id,
+                total_failures=failures,
+                total_cameras_impacted=total_cameras,
+                last_failure=last_failure,
             )
+            for host_id, failures, total_cameras, last_failure in rows
+        ]
+    _stats_cache = (etag, stats)
+    response.headers["ETag"] = etag
     return stats
 
 
@@ -167,31 +225,73 @@ def get_failure(failure_id: int) -> FailureEventRead:
     return _serialize_failure(failure)
 
 
+# Projection used when callers skip the raw JSON blob; keeps the large TEXT
+# column from being read off disk at all.
+_LOG_SUMMARY_COLUMNS = (
+    LogEntry.id,
+    LogEntry.host_id,
+    LogEntry.service,
+    LogEntry.timestamp,
+    LogEntry.level,
+    LogEntry.message,
+    LogEntry.created_at,
+)
+
+
+def _log_summary_entries(rows: Iterable[tuple]) -> List[dict]:
+    return [
+        {
+            "id": row[0],
+            "host_id": row[1],
+            "service": row[2],
+            "timestamp": row[3],
+            "level": row[4],
+            "message": row[5],
+            "created_at": row[6],
+            "raw": {},
+        }
+        for row in rows
+    ]
+
+
 @router.get("/{failure_id}/logs", response_model=List[LogEntryRead])
-def failure_logs(failure_id: int) -> List[LogEntryRead]:
+def failure_logs(failure_id: int, include_raw: bool = True) -> List[LogEntryRead]:
     with get_session() as session:
         failure = session.get(FailureEvent, failure_id)
         if not failure:
             raise HTTPException(status_code=404, detail="Failure not found")
+        query = select(LogEntry) if include_raw else select(*_LOG_SUMMARY_COLUMNS)
         query = (
-            select(LogEntry)
-            .where(LogEntry.host_id == failure.host_id)
+            query.where(LogEntry.host_id == failure.host_id)
             .order_by(LogEntry.timestamp.desc())
             .limit(500)
         )
         entries = session.exec(query).all()
-    return entries
+    if include_raw:
+        return entries
+    return _log_summary_entries(entries)
 
 
 @router.get("/host/{host_id}/logs", response_model=List[LogEntryRead])
-def host_logs(host_id: int, service: Optional[str] = None, limit: int = Query(200, le=2000)) -> List[LogEntryRead]:
+def host_logs(
+    host_id: int,
+    service: Optional[str] = None,
+    before: Optional[datetime] = None,
+    include_raw: bool = True,
+    limit: int = Query(200, le=2000),
+) -> List[LogEntryRead]:
     with get_session() as session:
-        query = select(LogEntry).where(LogEntry.host_id == host_id)
+        query = select(LogEntry) if include_raw else select(*_LOG_SUMMARY_COLUMNS)
+        query = query.where(LogEntry.host_id == host_id)
         if service:
             query = query.where(LogEntry.service == service)
+        if before:
+            query = query.where(LogEntry.timestamp < before)
         query = query.order_by(LogEntry.timestamp.desc()).limit(limit)
         entries = session.exec(query).all()
-    return entries
+    if include_raw:
+        return entries
+    return _log_summary_entries(entries)
 
 
 @router.get("/host/{host_id}/summary")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, update
 from sqlmodel import select
 
 from ..database import get_session
@@ -14,40 +16,59 @@ from ..services.monitor import queue_host_check
 
 router = APIRouter(prefix="/hosts", tags=["hosts"])
 
+# Bound once so the write handlers skip the module attribute lookup per call.
+_utcnow = datetime.utcnow
+
+# Host rows change only through the CRUD endpoints below, so the listing can
+# be served from memory between writes.
+_hosts_cache: Optional[List[Host]] = None
+
+
+def _invalidate_hosts_cache() -> None:
+    global _hosts_cache
+    _hosts_cache = None
+
 
 @router.get("", response_model=List[HostRead])
 def list_hosts() -> List[HostRead]:
-    with get_session() as session:
-        hosts = session.exec(select(Host)).all()
-    return hosts
+    global _hosts_cache
+    if _hosts_cache is None:
+        with get_session() as session:
+            _hosts_cache = session.exec(select(Host)).all()
+    return _hosts_cache
 
 
 @router.post("", response_model=HostRead)
 def create_host(payload: HostCreate) -> HostRead:
-    host = Host.from_orm(payload)
-    now = datetime.utcnow()
-    host.created_at = now
-    host.updated_at = now
+    now = _utcnow()
+    data = payload.dict()
+    data["created_at"] = now
+    data["updated_at"] = now
     with get_session() as session:
-        session.add(host)
+        host = session.scalars(insert(Host).returning(Host), data).one()
+        # Detach before commit so the RETURNING-loaded attributes survive
+        # the session's expire-on-commit instead of forcing a re-SELECT.
+        session.expunge(host)
         session.commit()
-        session.refresh(host)
+    _invalidate_hosts_cache()
     return host
 
 
 @router.put("/{host_id}", response_model=HostRead)
 def update_host(host_id: int, payload: HostUpdate) -> HostRead:
+    data = payload.dict(exclude_unset=True)
+    data["updated_at"] = _utcnow()
     with get_session() as session:
-        host = session.get(Host, host_id)
+        host = session.scalars(
+            update(Host).where(Host.id == host_id).values(**data).returning(Host)
+        ).one_or_none()
         if not host:
             raise HTTPException(status_code=404, detail="Host not found")
-        data = payload.dict(exclude_unset=True)
-        for key, value in data.items():
-            setattr(host, key, value)
-        host.updated_at = datetime.utcnow()
-        session.add(host)
+        # Detach before commit so the RETURNING-loaded attributes survive
+        # the session's expire-on-commit instead of forcing a re-SELECT.
+        session.expunge(host)
         session.commit()
-        session.refresh(host)
+    _invalidate_hosts_cache()
     return host
 
 
@@ -59,17 +80,22 @@ def delete_host(host_id: int) -> dict:
             raise HTTPException(status_code=404, detail="Host not found")
         session.delete(host)
         session.commit()
+    _invalidate_hosts_cache()
     return {"status": "deleted"}
 
 
+def _get_host(host_id: int) -> Optional[Host]:
+    with get_session() as session:
+        return session.get(Host, host_id)
+
+
 @router.post("/{host_id}/check", response_model=HostCheckRead, status_code=status.HTTP_202_ACCEPTED)
 async def trigger_host_check(host_id: int, request: Request) -> HostCheckRead:
-    with get_session() as session:
-        host = session.get(Host, host_id)
-        if not host:
-            raise HTTPException(status_code=404, detail="Host not found")
+    host = await run_in_threadpool(_get_host, host_id)
+    if not host:
+        raise HTTPException(status_code=404, detail="Host not found")
     config_manager = getattr(request.app.state, "config_manager", None)
     if config_manager is None:
         raise HTTPException(status_code=500, detail="Configuration manager unavailable")
     check = queue_host_check(host_id, config_manager, trigger="manual")
-    return HostCheckRead.from_orm(check)
+    return check
@@ -24,6 +24,9 @@ class HostUpdate(BaseModel):
 
 class HostRead(HostBase):
     id: int
+    # Stored URLs were validated on create/update; re-running HttpUrl parsing
+    # for every row of every listing is wasted work.
+    base_url: str
     created_at: datetime
     updated_at: datetime
 
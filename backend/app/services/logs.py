@@ -1,29 +1,36 @@
 from __future__ import annotations
 
-import json
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
+import orjson
+from sqlalchemy import insert
 from sqlmodel import Session
 
 from ..models import LogEntry
 
 TIMESTAMP_PATTERN = re.compile(
-    r"(\\d{4}-\\d{2}-\\d{2}[T\s]\\d{2}:\\d{2}:\\d{2}(?:\\.\\d+)?(?:Z|[+-]\\d{2}:?\\d{2})?)"
+    r"(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)"
 )
 
 
-def save_log_file(hostname: str, service: str, content: str, base_dir: Path) -> Path:
+def save_log_file(hostname: str, service: str, content: str | bytes, base_dir: Path) -> Path:
     base_dir.mkdir(parents=True, exist_ok=True)
     filename = f"{hostname}-{service}.log"
     path = base_dir / filename
-    path.write_text(content, encoding="utf-8")
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    path.write_bytes(content)
     return path
 
 
+@lru_cache(maxsize=4096)
 def parse_timestamp(value: str) -> Optional[datetime]:
+    # Log batches repeat identical timestamps heavily (same second across
+    # many lines), so a bounded memo beats re-parsing each occurrence.
     try:
         return datetime.fromisoformat(value.replace("Z", "+00:00"))
     except ValueError:
@@ -37,19 +44,24 @@ def extract_timestamp_from_line(line: str) -> Optional[datetime]:
     return parse_timestamp(match.group(1))
 
 
-def parse_log_entries(content: str) -> List[dict]:
+def parse_log_entries(content: str | bytes) -> List[dict]:
+    # Bytes input avoids decoding the whole payload up front: orjson parses
+    # bytes natively, so only the non-JSON fallback lines get decoded.
+    json_prefix = b"{" if isinstance(content, bytes) else "{"
     entries: List[dict] = []
     for raw_line in content.splitlines():
         raw_line = raw_line.strip()
         if not raw_line:
             continue
         parsed: Optional[dict] = None
-        if raw_line.startswith("{"):
+        if raw_line.startswith(json_prefix):
             try:
-                parsed = json.loads(raw_line)
-            except json.JSONDecodeError:
+                parsed = orjson.loads(raw_line)
+            except orjson.JSONDecodeError:
                 parsed = None
         if parsed is None:
+            if isinstance(raw_line, bytes):
+                raw_line = raw_line.decode("utf-8", errors="replace")
             timestamp = extract_timestamp_from_line(raw_line)
             parsed = {
                 "message": raw_line,
@@ -64,39 +76,47 @@ def persist_log_entries(
     host_id: int,
     service: str,
     entries: Iterable[dict],
-) -> List[LogEntry]:
-    stored: List[LogEntry] = []
+    *,
+    commit: bool = True,
+) -> int:
+    now = datetime.utcnow()
+    mappings: List[dict] = []
     for entry in entries:
         timestamp = entry.get("timestamp")
         if isinstance(timestamp, str):
             timestamp = parse_timestamp(timestamp)
-        log = LogEntry(
-            host_id=host_id,
-            service=service,
-            timestamp=timestamp,
-            level=entry.get("level") or entry.get("severity"),
-            message=entry.get("message") or entry.get("msg"),
-            raw=entry,
+        mappings.append(
+            {
+                "host_id": host_id,
+                "service": service,
+                "timestamp": timestamp,
+                "level": entry.get("level") or entry.get("severity"),
+                "message": entry.get("message") or entry.get("msg"),
+                "raw": entry,
+                "created_at": now,
+            }
         )
-        session.add(log)
-        stored.append(log)
-    session.commit()
-    for log in stored:
-        session.refresh(log)
-    return stored
+    if mappings:
+        session.execute(insert(LogEntry), mappings)
+    if commit:
+        session.commit()
+    return len(mappings)
 
 
 def estimate_failure_start(entries: Iterable[dict], tz) -> Optional[datetime]:
-    interesting: List[datetime] = []
+    # Track the minimum as entries stream past instead of collecting every
+    # localized timestamp just to call min() on the list.
+    earliest: Optional[datetime] = None
     for entry in entries:
         timestamp = entry.get("timestamp")
         if isinstance(timestamp, str):
             parsed = parse_timestamp(timestamp)
         else:
             parsed = timestamp
-        if parsed:
-            interesting.append(parsed.astimezone(tz) if parsed.tzinfo else parsed.replace(tzinfo=tz))
-    if not interesting:
-        return None
-    return min(interesting)
+        if not parsed:
+            continue
+        localized = parsed.astimezone(tz) if parsed.tzinfo else parsed.replace(tzinfo=tz)
+        if earliest is None or localized < earliest:
+            earliest = localized
+    return earliest
 
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Literal, Optional, TypedDict
 
 import httpx
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, async_playwright
 from sqlmodel import select
 
 from ..config import ConfigManager
@@ -19,12 +20,55 @@ from ..services.logs import (
     persist_log_entries,
     save_log_file,
 )
-from ..services.notifications import send_media, send_message
+from ..services.notifications import send_media_group, send_message
 from ..utils.paths import LOG_DIR, SCREENSHOT_DIR
 from ..utils.timezone import now_tz
 
 logger = logging.getLogger(__name__)
 
+FAILURE_TEXT = "No frames have been received, check error logs"
+LOG_SERVICES = ("go2rtc", "nginx", "frigate")
+
+_DETECT_FAILED_CAMERAS_JS = """
+(failureText) => {
+    // Walk text nodes directly instead of materializing every element and
+    // re-scanning its (aggregated) textContent; this touches each piece of
+    // text once and dedupes cards that repeat the failure message.
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    const identifiers = new Set();
+    let node;
+    while ((node = walker.nextNode())) {
+        if (!node.nodeValue || !node.nodeValue.includes(failureText)) {
+            continue;
+        }
+        const card = node.parentElement &&
+            node.parentElement.closest('[data-camera], .camera-card, article, section, div');
+        let identifier = 'unknown';
+        if (card) {
+            if (card.dataset && card.dataset.camera) {
+                identifier = card.dataset.camera;
+            } else if (card.id) {
+                identifier = card.id;
+            } else {
+                const heading = card.querySelector('h1, h2, h3, h4, h5, h6, .title');
+                if (heading && heading.textContent) {
+                    identifier = heading.textContent.trim();
+                }
+            }
+        }
+        identifiers.add(identifier);
+    }
+    return [...identifiers];
+}
+"""
+
+
+@lru_cache(maxsize=8)
+def _mention_html(mention_user_ids: str) -> str:
+    """Build the invisible-mention anchors once per configured ID list."""
+    ids = [uid.strip() for uid in mention_user_ids.split(",") if uid.strip()]
+    return " ".join(f"<a href=\"tg://user?id={uid}\">.</a>" for uid in ids)
+
 
 class HostCheckResult(TypedDict):
     status: Literal["success", "failure", "error"]
@@ -32,41 +76,107 @@ class HostCheckResult(TypedDict):
     failure_event: Optional[FailureEvent]
 
 
+# Camera signature of the last confirmed failure per host id, used to skip
+# re-downloading identical logs and re-notifying while an outage persists.
+_last_failure_signatures: Dict[int, str] = {}
+
+_playwright = None
+_browser: Optional[Browser] = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+
+async def get_browser() -> Browser:
+    """Return a shared Chromium instance, launching it on first use.
+
+    Launching a browser costs hundreds of milliseconds; checks only need a
+    fresh, isolated BrowserContext, so the browser itself is reused across
+    checks and cycles.
+    """
+    global _playwright, _browser, _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+        return _browser
+
+
+async def close_browser() -> None:
+    global _playwright, _browser
+    if _browser is not None:
+        if _browser.is_connected():
+            await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+# Caps concurrently open browser contexts (scheduled and manual checks
+# alike) without pinning a slot across the retry sleep or upload phases.
+_check_slots: Optional[asyncio.Semaphore] = None
+_check_slots_size = 0
+
+
+def _browser_slots(limit: int) -> asyncio.Semaphore:
+    global _check_slots, _check_slots_size
+    limit = max(1, limit)
+    if _check_slots is None or _check_slots_size != limit:
+        _check_slots = asyncio.Semaphore(limit)
+        _check_slots_size = limit
+    return _check_slots
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return a shared AsyncClient so log fetches reuse keep-alive connections."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+# Camera previews (MJPEG/video) keep the connection busy indefinitely and
+# fonts are irrelevant to detection. Images and stylesheets are allowed
+# through so the Telegram screenshots stay legible.
+_BLOCKED_RESOURCE_TYPES = {"media", "font"}
+
+
+async def _abort_blocked_requests(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 async def _fetch_page_screenshot(page, output_path: Path) -> str:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    await page.screenshot(path=str(output_path), full_page=True)
+    # JPEG at quality 75 is a fraction of the size of a full-page PNG, which
+    # matters because every screenshot is also uploaded to Telegram. Taking
+    # the bytes and writing them off-loop keeps disk latency out of the
+    # event loop instead of letting Playwright block on the path write.
+    data = await page.screenshot(full_page=True, type="jpeg", quality=75)
+    await asyncio.to_thread(output_path.write_bytes, data)
     return str(output_path)
 
 
 async def _detect_failed_cameras(page) -> Dict[str, List[str]]:
     await page.wait_for_timeout(2000)
-    failed = await page.evaluate(
-        """
-        () => {
-            const failureText = "No frames have been received, check error logs";
-            const elements = Array.from(
-                document.querySelectorAll('*')
-            ).filter(el => el.textContent && el.textContent.includes(failureText));
-            return elements.map(el => {
-                const card = el.closest('[data-camera], .camera-card, article, section, div');
-                let identifier = 'unknown';
-                if (card) {
-                    if (card.dataset && card.dataset.camera) {
-                        identifier = card.dataset.camera;
-                    } else if (card.id) {
-                        identifier = card.id;
-                    } else {
-                        const heading = card.querySelector('h1, h2, h3, h4, h5, h6, .title');
-                        if (heading && heading.textContent) {
-                            identifier = heading.textContent.trim();
-                        }
-                    }
-                }
-                return identifier;
-            });
-        }
-        """
-    )
+    failed = await page.evaluate(_DETECT_FAILED_CAMERAS_JS, FAILURE_TEXT)
     return {"camera_ids": failed, "count": len(failed)}
 
 
@@ -103,30 +213,32 @@ def _update_check_record(
     mark_started: bool = False,
     finished: bool = False,
     failure_event_id: Optional[int] = None,
-) -> Optional[HostCheck]:
+) -> None:
+    # One clock read per update; the local wall time for the log line and the
+    # naive UTC stamps for the row columns both derive from it.
+    now_local = now_tz(timezone)
+    now = now_local.astimezone(dt_timezone.utc).replace(tzinfo=None)
     with get_session() as session:
         check = session.get(HostCheck, check_id)
         if not check:
-            return None
+            return
         log_entries = list(check.log or [])
         if message:
-            log_entries.append({"timestamp": now_tz(timezone).isoformat(), "message": message})
+            log_entries.append({"timestamp": now_local.isoformat(), "message": message})
             check.log = log_entries
         if status:
             check.status = status
         if summary is not None:
             check.summary = summary
         if mark_started and check.started_at is None:
-            check.started_at = datetime.utcnow()
+            check.started_at = now
         if finished:
-            check.finished_at = datetime.utcnow()
+            check.finished_at = now
         if failure_event_id is not None:
             check.failure_event_id = failure_event_id
-        check.updated_at = datetime.utcnow()
+        check.updated_at = now
         session.add(check)
         session.commit()
-        session.refresh(check)
-        return check
 
 
 class HostCheckRecorder:
@@ -153,11 +265,14 @@ class HostCheckRecorder:
         *,
         failure_event_id: Optional[int] = None,
     ) -> None:
+        # Record the summary as the final log line in the same write instead
+        # of a separate log() round trip.
         _update_check_record(
             self.check_id,
             self.timezone,
             status=status,
             summary=summary,
+            message=summary,
             finished=True,
             failure_event_id=failure_event_id,
         )
@@ -168,6 +283,7 @@ class HostCheckRecorder:
             self.timezone,
             status="skipped",
             summary=summary,
+            message=summary,
             finished=True,
         )
 
@@ -198,7 +314,6 @@ async def run_host_check(check_id: int, config_manager: ConfigManager) -> None:
         return
 
     summary = result["summary"]
-    recorder.log(summary)
     if result["status"] == "failure":
         failure_event = result["failure_event"]
         failure_id = failure_event.id if failure_event else None
@@ -218,6 +333,36 @@ def queue_host_check(host_id: int, config_manager: ConfigManager, trigger: str =
     return check
 
 
+async def _send_failure_notifications(
+    config,
+    message: str,
+    screenshots: List[str],
+    log_files: List[str],
+    recorder: Optional[HostCheckRecorder],
+) -> None:
+    try:
+        await send_message(config, message)
+    except Exception as exc:  # pragma: no cover - network
+        logger.exception("Failed to send Telegram message: %s", exc)
+        if recorder:
+            recorder.log(f"Telegram message failed: {exc}")
+
+    if screenshots:
+        try:
+            await send_media_group(config, screenshots)
+        except Exception as exc:  # pragma: no cover - network
+            logger.exception("Failed to send Telegram screenshots: %s", exc)
+            if recorder:
+                recorder.log(f"Screenshot upload failed: {exc}")
+
+    try:
+        await send_media_group(config, log_files, media_type="document")
+    except Exception as exc:  # pragma: no cover - network
+        logger.exception("Failed to send Telegram logs: %s", exc)
+        if recorder:
+            recorder.log(f"Log upload failed: {exc}")
+
+
 async def check_host(
     host: Host,
     config_manager: ConfigManager,
@@ -230,20 +375,23 @@ async def check_host(
     hostname = host.name
     first_screenshot: Optional[str] = None
     second_screenshot: Optional[str] = None
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+    # Hold a slot only while a browser context is open; the retry sleep and
+    # the log/notification phases use no capped resource.
+    slots = _browser_slots(config.max_concurrent_checks)
+    async with slots:
+        browser = await get_browser()
         context = await browser.new_context()
+        await context.route("**/*", _abort_blocked_requests)
         page = await context.new_page()
         if recorder:
             recorder.log("Loading Frigate dashboard")
         try:
-            await page.goto(host.base_url, wait_until="networkidle", timeout=60000)
+            await page.goto(host.base_url, wait_until="domcontentloaded", timeout=30000)
         except Exception as exc:  # pragma: no cover - defensive
             logger.exception("Failed to load Frigate host %s: %s", host.base_url, exc)
             if recorder:
                 recorder.log(f"Failed to load dashboard: {exc}")
             await context.close()
-            await browser.close()
             return {
                 "status": "error",
                 "summary": "Unable to load Frigate dashboard",
@@ -254,37 +402,36 @@ async def check_host(
             recorder.log(f"Initial scan detected {detection['count']} failing cameras")
         if detection["count"] == 0:
             await context.close()
-            await browser.close()
+            _last_failure_signatures.pop(host.id, None)
             return {
                 "status": "success",
                 "summary": "No failing cameras detected",
                 "failure_event": None,
             }
-        first_path = SCREENSHOT_DIR / f"{hostname}-{timestamp.strftime('%Y%m%dT%H%M%S')}-initial.png"
+        first_path = SCREENSHOT_DIR / f"{hostname}-{timestamp.strftime('%Y%m%dT%H%M%S')}-initial.jpg"
         first_screenshot = await _fetch_page_screenshot(page, first_path)
         if recorder:
             recorder.log("Captured initial screenshot")
         await context.close()
-        await browser.close()
 
     if recorder:
         recorder.log(f"Waiting {config.retry_delay_minutes} minutes before retry")
     await asyncio.sleep(config.retry_delay_minutes * 60)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+    async with slots:
+        browser = await get_browser()
         context = await browser.new_context()
+        await context.route("**/*", _abort_blocked_requests)
         page = await context.new_page()
         if recorder:
             recorder.log("Retrying Frigate dashboard after delay")
         try:
-            await page.goto(host.base_url, wait_until="networkidle", timeout=60000)
+            await page.goto(host.base_url, wait_until="domcontentloaded", timeout=30000)
         except Exception as exc:  # pragma: no cover - defensive
             logger.exception("Failed to load Frigate host on retry %s: %s", host.base_url, exc)
             if recorder:
                 recorder.log(f"Retry failed to load dashboard: {exc}")
             await context.close()
-            await browser.close()
             return {
                 "status": "error",
                 "summary": "Retry failed to load dashboard",
@@ -294,14 +441,14 @@ async def check_host(
         if recorder:
             recorder.log(f"Retry detected {second_detection['count']} failing cameras")
         retry_timestamp = now_tz(timezone)
-        second_path = SCREENSHOT_DIR / f"{hostname}-{retry_timestamp.strftime('%Y%m%dT%H%M%S')}-retry.png"
+        second_path = SCREENSHOT_DIR / f"{hostname}-{retry_timestamp.strftime('%Y%m%dT%H%M%S')}-retry.jpg"
         second_screenshot = await _fetch_page_screenshot(page, second_path)
         if recorder:
             recorder.log("Captured retry screenshot")
         await context.close()
-        await browser.close()
 
     if second_detection["count"] == 0:
+        _last_failure_signatures.pop(host.id, None)
         return {
             "status": "success",
             "summary": "Issue cleared before retry completed",
@@ -312,29 +459,46 @@ async def check_host(
     if recorder:
         recorder.log(f"Failure persists for {second_detection['count']} cameras: {', '.join(camera_ids)}")
 
-    services = ["go2rtc", "nginx", "frigate"]
+    signature = ",".join(sorted(camera_ids))
+    if _last_failure_signatures.get(host.id) == signature:
+        if recorder:
+            recorder.log("Same cameras still failing; skipping log download and re-notification")
+        return {
+            "status": "failure",
+            "summary": f"Failure persists for {second_detection['count']} cameras (unchanged)",
+            "failure_event": None,
+        }
+
+    services = LOG_SERVICES
     log_files: List[str] = []
     parsed_entries: Dict[str, List[dict]] = {}
-    async with httpx.AsyncClient(timeout=60) as client:
-        for service in services:
-            url = f"{host.base_url}/api/logs/{service}"
+
+    async def fetch_service_log(client: httpx.AsyncClient, service: str) -> bytes:
+        url = f"{host.base_url}/api/logs/{service}"
+        if recorder:
+            recorder.log(f"Fetching {service} logs")
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.content
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to fetch log %s from %s: %s", service, host.base_url, exc)
             if recorder:
-                recorder.log(f"Fetching {service} logs")
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                content = response.text
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("Failed to fetch log %s from %s: %s", service, host.base_url, exc)
-                if recorder:
-                    recorder.log(f"Failed to fetch {service} logs: {exc}")
-                content = ""
+                recorder.log(f"Failed to fetch {service} logs: {exc}")
+            return b""
+
+    client = get_http_client()
+    contents = await asyncio.gather(
+        *(fetch_service_log(client, service) for service in services)
+    )
+    with get_session() as session:
+        for service, content in zip(services, contents):
             path = save_log_file(hostname, service, content, LOG_DIR)
             log_files.append(str(path))
             entries = parse_log_entries(content)
             parsed_entries[service] = entries
-            with get_session() as session:
-                persist_log_entries(session, host.id, service, entries)
+            persist_log_entries(session, host.id, service, entries, commit=False)
+        session.commit()
 
     failure_start = None
     for service in services:
@@ -367,6 +531,8 @@ async def check_host(
         session.commit()
         session.refresh(failure_event)
 
+    _last_failure_signatures[host.id] = signature
+
     summary = f"Detected {second_detection['count']} failing cameras"
     if recorder:
         recorder.log("Failure recorded and notifications scheduled")
@@ -381,39 +547,26 @@ async def check_host(
         message_lines.append(
             f"Estimated start: {normalized_failure_start.strftime('%Y-%m-%d %H:%M:%S')} GMT-3"
         )
-    config = config_manager.get()
     if config.mention_name:
         message_lines.append(config.mention_name)
-    if config.mention_user_ids:
-        ids = [uid.strip() for uid in config.mention_user_ids.split(",") if uid.strip()]
-        mentions = " ".join(f"<a href=\"tg://user?id={uid}\">.</a>" for uid in ids)
+    if mentions := _mention_html(config.mention_user_ids):
         message_lines.append(mentions)
 
-    try:
-        await send_message(config, "\n".join(message_lines))
-    except Exception as exc:  # pragma: no cover - network
-        logger.exception("Failed to send Telegram message: %s", exc)
-        if recorder:
-            recorder.log(f"Telegram message failed: {exc}")
-
-    if first_screenshot and second_screenshot:
-        try:
-            await send_media(
-                config,
-                [first_screenshot, second_screenshot],
-                media_type="photo",
-            )
-        except Exception as exc:  # pragma: no cover - network
-            logger.exception("Failed to send Telegram screenshots: %s", exc)
-            if recorder:
-                recorder.log(f"Screenshot upload failed: {exc}")
-
-    try:
-        await send_media(config, log_files, media_type="document")
-    except Exception as exc:  # pragma: no cover - network
-        logger.exception("Failed to send Telegram logs: %s", exc)
-        if recorder:
-            recorder.log(f"Log upload failed: {exc}")
+    # Uploads can take many seconds on real log files; dispatch them in the
+    # background so the check (and its semaphore slot) finishes as soon as
+    # the failure is recorded. Errors are still logged per phase.
+    asyncio.create_task(
+        _send_failure_notifications(
+            config,
+            "\n".join(message_lines),
+            [first_screenshot, second_screenshot]
+            if first_screenshot and second_screenshot
+            else [],
+            log_files,
+            recorder,
+        ),
+        name=f"failure-notify-{host.id}",
+    )
 
     return {
         "status": "failure",
@@ -425,12 +578,14 @@ async def check_host(
 async def run_monitoring(config_manager: ConfigManager) -> None:
     with get_session() as session:
         hosts = session.exec(select(Host).where(Host.enabled == True)).all()  # noqa: E712
+    if not hosts:
+        return
+    # Browser concurrency is capped inside check_host via _browser_slots, so
+    # the fan-out itself stays unbounded and cheap.
     tasks: List[asyncio.Task[None]] = []
     for host in hosts:
         check = create_host_check(host.id, "scheduled", config_manager)
         tasks.append(asyncio.create_task(run_host_check(check.id, config_manager)))
-    if not tasks:
-        return
     results = await asyncio.gather(*tasks, return_exceptions=True)
     for result in results:
         if isinstance(result, Exception):  # pragma: no cover - logging
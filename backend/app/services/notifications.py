@@ -1,81 +1,135 @@
 from __future__ import annotations
 
-import json
+import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
 
 import httpx
+import orjson
 
 from ..config import AppConfig
 
 TELEGRAM_API = "https://api.telegram.org/bot{token}/{method}"
 
 
+@lru_cache(maxsize=32)
+def _api_url(token: str, method: str) -> str:
+    return TELEGRAM_API.format(token=token, method=method)
+
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return a shared AsyncClient so Telegram calls reuse one TLS connection.
+
+    A single failure produces a message plus several uploads; reconnecting to
+    api.telegram.org for each would pay a TLS handshake per call.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60, read=None),
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
 async def send_message(config: AppConfig, message: str) -> None:
     if not config.telegram_bot_token or not config.telegram_chat_id:
         return
-    async with httpx.AsyncClient(timeout=30) as client:
-        await client.post(
-            TELEGRAM_API.format(token=config.telegram_bot_token, method="sendMessage"),
-            data={
-                "chat_id": config.telegram_chat_id,
-                "text": message,
-                "parse_mode": "HTML",
-                "disable_web_page_preview": True,
-            },
-        )
+    await get_client().post(
+        _api_url(config.telegram_bot_token, "sendMessage"),
+        data={
+            "chat_id": config.telegram_chat_id,
+            "text": message,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True,
+        },
+    )
 
 
-async def send_media(
+def _guess_mime(path: str) -> str:
+    if path.endswith((".jpg", ".jpeg")):
+        return "image/jpeg"
+    if path.endswith(".png"):
+        return "image/png"
+    return "application/octet-stream"
+
+
+def _has_content(path: str) -> bool:
+    try:
+        return Path(path).stat().st_size > 0
+    except OSError:
+        return False
+
+
+async def _send_single(
     config: AppConfig,
-    file_paths: Iterable[str],
-    caption: str | None = None,
-    media_type: str = "document",
+    path: str,
+    payload: bytes,
+    caption: str | None,
+    media_type: str,
 ) -> None:
-    if not config.telegram_bot_token or not config.telegram_chat_id:
-        return
     method = "sendDocument" if media_type == "document" else "sendPhoto"
-    async with httpx.AsyncClient(timeout=None) as client:
-        for path in file_paths:
-            field_name = "document" if method == "sendDocument" else "photo"
-            with open(path, "rb") as file_handle:
-                files = {field_name: file_handle}
-                data = {"chat_id": config.telegram_chat_id}
-                if caption:
-                    data["caption"] = caption
-                    data["parse_mode"] = "HTML"
-                await client.post(
-                    TELEGRAM_API.format(token=config.telegram_bot_token, method=method),
-                    data=data,
-                    files=files,
-                )
+    field_name = "document" if media_type == "document" else "photo"
+    data = {"chat_id": config.telegram_chat_id}
+    if caption:
+        data["caption"] = caption
+        data["parse_mode"] = "HTML"
+    response = await get_client().post(
+        _api_url(config.telegram_bot_token, method),
+        data=data,
+        files={field_name: (Path(path).name, payload, _guess_mime(path))},
+    )
+    response.raise_for_status()
 
 
 async def send_media_group(
     config: AppConfig,
-    photos: List[str],
+    file_paths: List[str],
     caption: str | None = None,
+    media_type: str = "photo",
 ) -> None:
-    if not config.telegram_bot_token or not config.telegram_chat_id or not photos:
+    """Upload up to ten files in a single sendMediaGroup request.
+
+    Empty or missing files are dropped first — Telegram rejects a media
+    group containing a zero-byte attachment, which would sink the whole
+    batch. A group also needs at least two items, so a lone survivor goes
+    out as a plain sendDocument/sendPhoto instead.
+    """
+    if not config.telegram_bot_token or not config.telegram_chat_id:
+        return
+    paths = [path for path in file_paths if _has_content(path)]
+    if not paths:
+        return
+    payloads = await asyncio.gather(
+        *(asyncio.to_thread(Path(path).read_bytes) for path in paths)
+    )
+    if len(paths) == 1:
+        await _send_single(config, paths[0], payloads[0], caption, media_type)
         return
-    async with httpx.AsyncClient(timeout=None) as client:
-        media = []
-        for idx, photo in enumerate(photos):
-            entry = {"type": "photo", "media": "attach://photo{}".format(idx)}
-            if idx == 0 and caption:
-                entry["caption"] = caption
-                entry["parse_mode"] = "HTML"
-            media.append(entry)
-        files = {}
-        for idx, photo in enumerate(photos):
-            handle = open(photo, "rb")
-            files[f"photo{idx}"] = (Path(photo).name, handle, "image/png")
-        try:
-            await client.post(
-                TELEGRAM_API.format(token=config.telegram_bot_token, method="sendMediaGroup"),
-                data={"chat_id": config.telegram_chat_id, "media": json.dumps(media)},
-                files=files,
-            )
-        finally:
-            for _, handle, _ in files.values():
-                handle.close()
+    media = []
+    for idx, _ in enumerate(paths):
+        entry = {"type": media_type, "media": "attach://file{}".format(idx)}
+        if idx == 0 and caption:
+            entry["caption"] = caption
+            entry["parse_mode"] = "HTML"
+        media.append(entry)
+    files = {}
+    for idx, (path, payload) in enumerate(zip(paths, payloads)):
+        files[f"file{idx}"] = (Path(path).name, payload, _guess_mime(path))
+    response = await get_client().post(
+        _api_url(config.telegram_bot_token, "sendMediaGroup"),
+        data={"chat_id": config.telegram_chat_id, "media": orjson.dumps(media).decode()},
+        files=files,
+    )
+    response.raise_for_status()